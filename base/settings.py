@@ -114,3 +114,21 @@ STATIC_URL = 'static/'
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+
+# Group commit for event writes, see events/group_commit.py
+# When enabled, concurrent cancels issued within the window are committed together in one transaction.
+EVENTS_GROUP_COMMIT_ENABLED = False
+EVENTS_GROUP_COMMIT_WINDOW_MS = 5
+EVENTS_GROUP_COMMIT_MAX_BATCH = 100
+# Seconds a caller waits for its group to be committed before giving up.
+EVENTS_GROUP_COMMIT_TIMEOUT = 5
+
+# API documentation, see base/api_docs.py
+# Swagger and ReDoc are loaded on first request. Precompute the schema served at /swagger.json with:
+#   python manage.py generate_swagger --overwrite openapi.json
+API_DOCS_ENABLED = True
+API_SCHEMA_FILE = BASE_DIR / 'openapi.json'
+
+SWAGGER_SETTINGS = {
+    'DEFAULT_INFO': 'base.api_docs.api_info',
+}
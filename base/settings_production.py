@@ -0,0 +1,63 @@
+"""
+Production settings for the API-only deployment.
+
+Use with DJANGO_SETTINGS_MODULE=base.settings_production. Drops the admin, sessions, messages and
+static files apps together with their middleware, renders JSON only and leaves the Swagger/ReDoc
+pages off unless DJANGO_API_DOCS_ENABLED is set. The precomputed schema is still served at
+/swagger.json when it has been generated at build time.
+"""
+
+import os
+
+from django.core.exceptions import ImproperlyConfigured
+
+from base.settings import *  # noqa: F401,F403
+
+try:
+    SECRET_KEY = os.environ['DJANGO_SECRET_KEY']
+except KeyError:
+    raise ImproperlyConfigured("The DJANGO_SECRET_KEY environment variable must be set in production.")
+
+DEBUG = False
+
+ALLOWED_HOSTS = os.environ.get('DJANGO_ALLOWED_HOSTS', 'localhost').split(',')
+
+INSTALLED_APPS = [
+    'django.contrib.auth',
+    'django.contrib.contenttypes',
+    # Internal Apps
+    'events.apps.EventsConfig',
+    # External Apps
+    'rest_framework',
+]
+
+MIDDLEWARE = [
+    'django.middleware.security.SecurityMiddleware',
+    'django.middleware.common.CommonMiddleware',
+]
+
+TEMPLATES = [
+    {
+        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'DIRS': [],
+        'APP_DIRS': True,
+        'OPTIONS': {
+            'context_processors': [
+                'django.template.context_processors.request',
+            ],
+        },
+    },
+]
+
+REST_FRAMEWORK = {
+    'DEFAULT_RENDERER_CLASSES': ['rest_framework.renderers.JSONRenderer'],
+    'DEFAULT_AUTHENTICATION_CLASSES': [],
+    'UNAUTHENTICATED_USER': None,
+}
+
+API_DOCS_ENABLED = os.environ.get('DJANGO_API_DOCS_ENABLED', 'false').lower() == 'true'
+
+if API_DOCS_ENABLED:
+    INSTALLED_APPS += ['django.contrib.staticfiles', 'drf_yasg']
+    # Django does not serve static files with DEBUG off, collect them here and serve STATIC_URL from the web server.
+    STATIC_ROOT = os.environ.get('DJANGO_STATIC_ROOT', BASE_DIR / 'staticfiles')
@@ -1,25 +1,20 @@
-from django.contrib import admin
+from django.conf import settings
 from django.urls import path, include
-from rest_framework import permissions
-from drf_yasg.views import get_schema_view
-from drf_yasg import openapi
 
-schema_view = get_schema_view(
-    openapi.Info(
-        title="Event Reminder API",
-        default_version='v1',
-        description="API documentation for the Event Reminder application",
-        terms_of_service="https://www.google.com/policies/terms/",
-        contact=openapi.Contact(email="contact@example.com"),
-        license=openapi.License(name="BSD License"),
-    ),
-    public=True,
-    permission_classes=(permissions.AllowAny,),
-)
+from base import api_docs
 
 urlpatterns = [
-    path('admin/', admin.site.urls),
     path('api/', include('events.urls')),
-    path('swagger/', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
-    path('redoc/', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
+    path('swagger.json', api_docs.static_schema, name='schema-json'),
 ]
+
+if 'django.contrib.admin' in settings.INSTALLED_APPS:
+    from django.contrib import admin
+
+    urlpatterns.append(path('admin/', admin.site.urls))
+
+if settings.API_DOCS_ENABLED:
+    urlpatterns += [
+        path('swagger/', api_docs.swagger_ui, name='schema-swagger-ui'),
+        path('redoc/', api_docs.redoc_ui, name='schema-redoc'),
+    ]
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Event, UpcomingEvent, ExpiredEvent, ReminderSettings, CanceledEvent
+from .models import Event, UpcomingEvent, ExpiredEvent, ReminderSettings, CanceledEvent, ReminderDue
 
 
 class ReminderSettingsInline(admin.StackedInline):
@@ -9,8 +9,17 @@ class ReminderSettingsInline(admin.StackedInline):
     extra = 1
 
 
+class ReminderDueRecomputeMixin:
+    """Recompute the reminder due times of an event after it is saved from the admin."""
+
+    def save_related(self, request, form, formsets, change):
+        """Recompute reminder due times once the reminder settings inline is saved."""
+        super().save_related(request, form, formsets, change)
+        ReminderDue.objects.recompute(Event.objects.filter(pk=form.instance.pk))
+
+
 @admin.register(Event)
-class EventAdmin(admin.ModelAdmin):
+class EventAdmin(ReminderDueRecomputeMixin, admin.ModelAdmin):
     list_display = (
         'title', 'event_date', 'event_time', 'category', 'is_upcoming',
         'get_notification_methods'
@@ -68,17 +77,39 @@ class ExpiredEventAdmin(EventAdmin):
 
 
 @admin.register(CanceledEvent)
-class DeletedEventAdmin(admin.ModelAdmin):
+class DeletedEventAdmin(ReminderDueRecomputeMixin, admin.ModelAdmin):
     list_display = ('title', 'event_date', 'event_time', 'category', 'created_at', 'updated_at')
     ordering = ['event_date', 'event_time']
 
 
 @admin.register(ReminderSettings)
 class ReminderSettingsAdmin(admin.ModelAdmin):
-    list_display = ('event', 'reminder_time', 'notification_methods', 'reminder_note')
+    list_display = ('event', 'reminder_time', 'reminder_offsets', 'notification_methods', 'reminder_note')
     list_filter = ('reminder_time', 'notification_methods')
     search_fields = ('event__title', 'reminder_note')
 
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        ReminderDue.objects.recompute(Event.objects.filter(pk=obj.event_id))
+
+    def delete_model(self, request, obj):
+        """Fall back to the category defaults once the reminder settings are gone."""
+        super().delete_model(request, obj)
+        ReminderDue.objects.recompute(Event.objects.filter(pk=obj.event_id))
+
+    def delete_queryset(self, request, queryset):
+        event_ids = list(queryset.values_list('event_id', flat=True))
+        super().delete_queryset(request, queryset)
+        ReminderDue.objects.recompute(Event.objects.filter(pk__in=event_ids))
+
+
+@admin.register(ReminderDue)
+class ReminderDueAdmin(admin.ModelAdmin):
+    list_display = ('event', 'due_at', 'offset_minutes')
+    list_filter = ('due_at',)
+    search_fields = ('event__title',)
+    readonly_fields = ('event', 'due_at', 'offset_minutes')
+
 
 admin.site.site_header = "Event Reminder Administration"
 admin.site.site_title = "Event Reminder Admin Portal"
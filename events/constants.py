@@ -21,3 +21,24 @@ class NotificationMethodsChoices(models.TextChoices):
     SMS = 'SMS'
     APP = 'In-App Notification'
     PUSH = 'Push Notification'
+
+
+# Longest reminder offset, in minutes before the event (one year).
+MAX_REMINDER_OFFSET_MINUTES = 366 * 24 * 60
+
+# Widest window, in minutes, for listing due reminders (one week).
+MAX_DUE_WINDOW_MINUTES = 7 * 24 * 60
+
+# Default reminder offsets, in minutes before the event, for events without their own offsets.
+DEFAULT_REMINDER_OFFSETS = {
+    CategoryChoices.WORK: [15],
+    CategoryChoices.PERSONAL: [30],
+    CategoryChoices.SOCIAL: [60],
+    CategoryChoices.CONCERT: [24 * 60, 120],
+    CategoryChoices.ENTERTAINMENT: [120],
+    CategoryChoices.TRAVEL: [24 * 60, 180],
+    CategoryChoices.HEALTH: [24 * 60, 60],
+    CategoryChoices.EDUCATION: [30],
+    CategoryChoices.FINANCE: [24 * 60],
+    CategoryChoices.OTHER: [30],
+}
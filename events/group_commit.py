@@ -0,0 +1,143 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+
+
+class DirectWriter:
+    """Writer that applies every update immediately in the caller's thread and transaction."""
+
+    def update(self, queryset, **values):
+        return queryset.update(**values)
+
+
+class GroupCommitWriter:
+    """
+    Background writer that coalesces concurrent queryset updates into group commits.
+
+    Updates submitted within `window_ms` of each other (up to `max_batch` of them) are applied
+    by a single thread inside one transaction, so a burst of writes pays for one commit instead
+    of queueing one by one behind the database write lock. Each update runs in its own savepoint,
+    so a failing update only fails its own caller.
+    """
+
+    def __init__(self, window_ms=5, max_batch=100, timeout=5):
+        self.window = window_ms / 1000
+        self.max_batch = max_batch
+        self.timeout = timeout
+        self._queue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def submit(self, queryset, **values):
+        """Queue `queryset.update(**values)` and return a Future resolving to the updated row count."""
+        future = Future()
+        self._ensure_started()
+        self._queue.put((queryset, values, future))
+        return future
+
+    def update(self, queryset, **values):
+        """
+        Queue an update and block until its group has been committed.
+
+        An update that times out before the writer picks it up is never applied. One that times out
+        while its group is already being applied may still be committed, so callers must re-check
+        the affected rows before retrying.
+        :raises concurrent.futures.TimeoutError: if the group is not committed within `timeout` seconds
+        """
+        future = self.submit(queryset, **values)
+        try:
+            return future.result(timeout=self.timeout)
+        except TimeoutError:
+            # Only succeeds while the writer has not started applying this update.
+            future.cancel()
+            raise
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='events-group-commit', daemon=True)
+                self._thread.start()
+
+    def _collect(self):
+        """Block for the first pending update, then gather the rest of its group."""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.window
+
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _commit(self, batch):
+        """Apply a group of updates in one transaction and resolve their futures."""
+        results = []
+
+        try:
+            close_old_connections()
+            with transaction.atomic():
+                for queryset, values, future in batch:
+                    # Skip updates whose caller already gave up waiting.
+                    if not future.set_running_or_notify_cancel():
+                        continue
+                    try:
+                        with transaction.atomic():
+                            results.append((future, queryset.update(**values), None))
+                    except Exception as exc:
+                        results.append((future, None, exc))
+        except Exception as exc:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for future, count, exc in results:
+            if exc is None:
+                future.set_result(count)
+            else:
+                future.set_exception(exc)
+
+    def _run(self):
+        while True:
+            self._commit(self._collect())
+
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def get_writer():
+    """Return the process wide writer configured by the `EVENTS_GROUP_COMMIT_*` settings."""
+    global _writer
+    if not getattr(settings, 'EVENTS_GROUP_COMMIT_ENABLED', False):
+        return DirectWriter()
+
+    with _writer_lock:
+        if _writer is None:
+            _writer = GroupCommitWriter(
+                window_ms=getattr(settings, 'EVENTS_GROUP_COMMIT_WINDOW_MS', 5),
+                max_batch=getattr(settings, 'EVENTS_GROUP_COMMIT_MAX_BATCH', 100),
+                timeout=getattr(settings, 'EVENTS_GROUP_COMMIT_TIMEOUT', 5),
+            )
+    return _writer
+
+
+def update(queryset, writer=None, **values):
+    """
+    Apply `queryset.update(**values)` and return the number of updated rows.
+
+    The update goes through `writer`, by default the one returned by `get_writer()`: the background
+    group commit writer when `EVENTS_GROUP_COMMIT_ENABLED` is set, otherwise a direct update in the
+    caller. Updates issued inside an open transaction always run directly so they stay part of it.
+    """
+    if transaction.get_connection(queryset.db).in_atomic_block:
+        writer = DirectWriter()
+    return (writer or get_writer()).update(queryset, **values)
@@ -0,0 +1,90 @@
+import threading
+import time
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import OperationalError, connection
+from django.utils import timezone
+
+from events import group_commit
+from events.models import Event
+
+BENCHMARK_TITLE = "Cancel Contention Benchmark"
+
+
+class Command(BaseCommand):
+    help = ('Measure concurrent cancel throughput with and without group commit. '
+            'Creates, cancels and deletes benchmark events in the configured database, '
+            'so it only runs with --allow-writes.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--events', type=int, default=500, help='Number of events to cancel per run.')
+        parser.add_argument('--threads', type=int, default=16, help='Number of concurrent cancelling threads.')
+        parser.add_argument('--window-ms', type=float, default=5, help='Group commit window in milliseconds.')
+        parser.add_argument('--allow-writes', action='store_true',
+                            help='Confirm that benchmark events may be written to the configured database.')
+
+    def handle(self, *args, **options):
+        if not options['allow_writes']:
+            raise CommandError("This benchmark writes to the configured database, "
+                               "pass --allow-writes against a non production database.")
+        if options['events'] < 1 or options['threads'] < 1:
+            raise CommandError("--events and --threads must be at least 1.")
+
+        writers = {
+            'direct': group_commit.DirectWriter(),
+            'group_commit': group_commit.GroupCommitWriter(window_ms=options['window_ms']),
+        }
+        for mode, writer in writers.items():
+            elapsed, errors = self.run(options['events'], options['threads'], writer)
+
+            self.stdout.write(
+                f"{mode:>12}: {options['events']} cancels in {elapsed:.3f}s "
+                f"({options['events'] / elapsed:.0f}/s), {errors} failed"
+            )
+
+        self.stdout.write(self.style.SUCCESS("Benchmark finished."))
+
+    def run(self, event_count, thread_count, writer):
+        """Create `event_count` events, cancel them through `writer` from `thread_count` threads and delete them."""
+        today = timezone.now().date()
+        # A title unique to this run tags exactly the rows it creates.
+        title = f"{BENCHMARK_TITLE} {uuid.uuid4().hex}"
+
+        try:
+            Event.objects.bulk_create(
+                Event(title=title, description=BENCHMARK_TITLE, category='Other',
+                      event_date=today, event_time=timezone.now().time())
+                for _ in range(event_count)
+            )
+            events = list(Event.objects.filter(title=title))
+            errors = []
+            failures = []
+            chunks = [events[i::thread_count] for i in range(thread_count)]
+
+            def cancel(chunk):
+                try:
+                    for event in chunk:
+                        try:
+                            event.soft_delete(writer=writer)
+                        except (OperationalError, TimeoutError):
+                            errors.append(event.pk)
+                except Exception as exc:
+                    failures.append(exc)
+                finally:
+                    connection.close()
+
+            threads = [threading.Thread(target=cancel, args=(chunk,)) for chunk in chunks]
+            start = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            elapsed = time.perf_counter() - start
+
+            if failures:
+                raise failures[0]
+        finally:
+            Event.objects.filter(title=title).delete()
+
+        return elapsed, len(errors)
@@ -1,6 +1,6 @@
 from django.core.management.base import BaseCommand
 from django.utils import timezone
-from events.models import Event, ReminderSettings
+from events.models import Event, ReminderSettings, ReminderDue
 import random
 from datetime import timedelta, datetime
 
@@ -48,6 +48,7 @@ class Command(BaseCommand):
 
     def handle(self, *args, **kwargs):
         today = timezone.now().date()
+        event_ids = []
 
         for i in range(50):
             event_date = today + timedelta(days=random.randint(0, 10))
@@ -72,6 +73,7 @@ class Command(BaseCommand):
                 is_canceled=is_canceled
             )
             event.save()
+            event_ids.append(event.pk)
 
             notification_methods = random.sample(NOTIFICATION_METHODS_CHOICES, k=random.randint(1, 4))
             reminder_settings = ReminderSettings(
@@ -82,5 +84,7 @@ class Command(BaseCommand):
             )
             reminder_settings.save()
 
+        ReminderDue.objects.recompute(Event.objects.filter(pk__in=event_ids))
+
         self.stdout.write(
             self.style.SUCCESS(f"Successfully created 50 random events, with the last 5 marked as canceled."))
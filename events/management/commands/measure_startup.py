@@ -0,0 +1,87 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Runs in a fresh interpreter so every sample is a real cold start.
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import django
+from django.core.wsgi import get_wsgi_application
+application = get_wsgi_application()
+setup_done = time.perf_counter()
+from django.urls import get_resolver
+get_resolver().url_patterns
+urls_done = time.perf_counter()
+# The test client is not part of a real cold start, so importing it is left out of the timings.
+from django.test import Client
+client = Client(HTTP_HOST=sys.argv[2])
+request_start = time.perf_counter()
+response = client.get(sys.argv[1])
+first_request_done = time.perf_counter()
+print(json.dumps({
+    'setup': setup_done - start,
+    'urls': urls_done - setup_done,
+    'first_request': first_request_done - request_start,
+    'total': (urls_done - start) + (first_request_done - request_start),
+    'status': response.status_code,
+}))
+"""
+
+
+class Command(BaseCommand):
+    help = 'Measure cold start time (imports, URLconf and first request) of the Django process.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--runs', type=int, default=5, help='Number of cold starts to sample.')
+        parser.add_argument('--path', default='/api/', help='Path of the first request.')
+        parser.add_argument('--host', default=None, help='Host header of the first request.')
+        parser.add_argument('--importtime', type=int, default=0, metavar='N',
+                            help='Also show the N slowest imports reported by python -X importtime.')
+
+    def handle(self, *args, **options):
+        host = options['host'] or next((h for h in settings.ALLOWED_HOSTS if '*' not in h), 'localhost')
+        env = {**os.environ, 'DJANGO_SETTINGS_MODULE': settings.SETTINGS_MODULE}
+        command = [sys.executable, '-c', PROBE, options['path'], host]
+
+        samples = []
+        for _ in range(options['runs']):
+            result = self.run_probe(command, env)
+            samples.append(json.loads(result.stdout.strip().splitlines()[-1]))
+
+        self.stdout.write(f"Settings: {settings.SETTINGS_MODULE}, first request: GET {options['path']} "
+                          f"-> {samples[-1]['status']}")
+        for phase in ('setup', 'urls', 'first_request', 'total'):
+            values = [sample[phase] * 1000 for sample in samples]
+            self.stdout.write(f"{phase:>14}: median {statistics.median(values):8.1f} ms, "
+                              f"min {min(values):8.1f} ms, max {max(values):8.1f} ms")
+
+        if options['importtime']:
+            self.show_slowest_imports(command, env, options['importtime'])
+
+    def run_probe(self, command, env):
+        """Run the probe from the project directory so `base` is importable wherever manage.py was called from."""
+        result = subprocess.run(command, env=env, cwd=settings.BASE_DIR, capture_output=True, text=True)
+        if result.returncode:
+            raise CommandError(f"Startup probe failed with exit code {result.returncode}:\n{result.stderr}")
+        return result
+
+    def show_slowest_imports(self, command, env, limit):
+        """Print the `limit` imports with the highest cumulative time."""
+        result = self.run_probe([command[0], '-X', 'importtime', *command[1:]], env)
+
+        imports = []
+        for line in result.stderr.splitlines():
+            if not line.startswith('import time:') or 'cumulative' in line:
+                continue
+            _, cumulative, module = line.split(':', 1)[1].split('|')
+            imports.append((int(cumulative), module.strip()))
+
+        self.stdout.write("Slowest imports (cumulative):")
+        for cumulative, module in sorted(imports, reverse=True)[:limit]:
+            self.stdout.write(f"{cumulative / 1000:10.1f} ms  {module}")
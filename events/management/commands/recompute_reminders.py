@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from events.models import Event, ReminderDue
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the precomputed reminder due times of all events.'
+
+    def handle(self, *args, **kwargs):
+        ReminderDue.objects.recompute(Event.objects.all())
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Successfully computed {ReminderDue.objects.count()} reminder due times."))
@@ -1,9 +1,12 @@
 import datetime
-from django.db import models
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
 from django.utils import timezone
 from multiselectfield import MultiSelectField
 
-from events.constants import CategoryChoices, NotificationMethodsChoices
+from events import group_commit
+from events.constants import (CategoryChoices, NotificationMethodsChoices, DEFAULT_REMINDER_OFFSETS,
+                              MAX_REMINDER_OFFSET_MINUTES)
 
 
 class Event(models.Model):
@@ -36,18 +39,61 @@ class Event(models.Model):
     def __str__(self):
         return self.title
 
-    def soft_delete(self):
-        """Soft delete the event by marking it as canceled."""
+    def soft_delete(self, writer=None):
+        """
+        Soft delete the event by marking it as canceled.
+        :param writer: Writer applying the update, defaults to the one configured by the group commit settings
+        :return: False if the event was already canceled, True otherwise
+        """
+        now = timezone.now()
+        updated = group_commit.update(
+            Event.objects.filter(pk=self.pk, is_canceled=False), writer=writer,
+            is_canceled=True, updated_at=now
+        )
         self.is_canceled = True
-        self.save()
+        if updated:
+            self.updated_at = now
+        return bool(updated)
+
+    @property
+    def event_datetime(self):
+        """Aware datetime at which the event starts."""
+        return timezone.make_aware(datetime.datetime.combine(self.event_date, self.event_time),
+                                   timezone.get_current_timezone())
 
     @property
     def is_upcoming(self):
         """ Check if the event is in the upcoming 24 hours """
         now = timezone.now()
-        event_datetime = timezone.make_aware(datetime.datetime.combine(self.event_date, self.event_time),
-                                             timezone.get_current_timezone())
-        return now <= event_datetime <= now + datetime.timedelta(days=1)
+        return now <= self.event_datetime <= now + datetime.timedelta(days=1)
+
+    def get_reminder_due_times(self):
+        """
+        Resolve the reminders of the event into absolute due times.
+        Uses the offsets and the fixed reminder time of the reminder settings, falling back to
+        the category defaults when neither is set. Invalid offsets and ones that would fall before the
+        earliest representable date are ignored.
+        :return: Sorted list of (offset_minutes, due_at) tuples, offset_minutes is None for the fixed reminder time
+        """
+        reminder_settings = getattr(self, 'reminder_settings', None)
+        reminder_time = reminder_settings.reminder_time if reminder_settings else None
+        offsets = reminder_settings.reminder_offsets if reminder_settings else None
+        offsets = [offset for offset in offsets if is_reminder_offset(offset)] if isinstance(offsets, list) else []
+        if not offsets and not reminder_time:
+            offsets = DEFAULT_REMINDER_OFFSETS.get(self.category, [])
+
+        event_datetime = self.event_datetime
+        due_times = {}
+        for offset in offsets:
+            try:
+                due_times[event_datetime - datetime.timedelta(minutes=offset)] = offset
+            except OverflowError:
+                # The reminder would fall before the earliest representable date.
+                continue
+        if reminder_time:
+            due_times.setdefault(reminder_time, None)
+
+        return sorted(((offset, due_at) for due_at, offset in due_times.items()), key=lambda item: item[1])
 
 
 class UpcomingEventManager(models.Manager):
@@ -135,6 +181,20 @@ class CanceledEvent(Event):
         return f"Canceled: {self.title} on {self.event_date} at {self.event_time}"
 
 
+def is_reminder_offset(value):
+    """Check if the value is a valid reminder offset, a number of minutes up to MAX_REMINDER_OFFSET_MINUTES."""
+    return isinstance(value, int) and not isinstance(value, bool) and 0 <= value <= MAX_REMINDER_OFFSET_MINUTES
+
+
+def validate_reminder_offsets(value):
+    """Validate that reminder offsets are a list of integers between 0 and MAX_REMINDER_OFFSET_MINUTES."""
+    if not isinstance(value, list) or not all(is_reminder_offset(offset) for offset in value):
+        raise ValidationError(
+            f"Reminder offsets must be a list of whole minutes between 0 and {MAX_REMINDER_OFFSET_MINUTES}.",
+            code='invalid_reminder_offsets'
+        )
+
+
 class ReminderSettings(models.Model):
     """Model to handle reminders setting for an event."""
     event = models.OneToOneField(Event, on_delete=models.CASCADE, related_name="reminder_settings", )
@@ -148,6 +208,12 @@ class ReminderSettings(models.Model):
                                          verbose_name="Reminder Time",
                                          )
 
+    reminder_offsets = models.JSONField(default=list, blank=True, validators=[validate_reminder_offsets],
+                                        help_text="Send reminders this many minutes before the event. "
+                                                  "Leave empty, without a reminder time, "
+                                                  "to use the defaults of the event's category.",
+                                        verbose_name="Reminder Offsets")
+
     reminder_note = models.TextField(null=True, blank=True,
                                      help_text="Contextual message based on the event's category.",
                                      verbose_name="Reminder Note")
@@ -158,3 +224,49 @@ class ReminderSettings(models.Model):
     class Meta:
         verbose_name = "Event Reminder Settings"
         verbose_name_plural = "Event Reminder Settings"
+
+
+class ReminderDueManager(models.Manager):
+    """Custom Manager for querying and rebuilding precomputed reminder due times."""
+
+    def due_between(self, start, end):
+        """Reminders of non canceled events due in [start, end), answered by a range scan on the due_at index."""
+        return self.get_queryset().filter(
+            due_at__gte=start, due_at__lt=end, event__is_canceled=False
+        ).select_related('event')
+
+    def recompute(self, events):
+        """
+        Rebuild the due times of the given events in bulk, canceled events get none.
+        :param events: Event queryset whose reminders moved
+        """
+        due_times = [
+            ReminderDue(event=event, offset_minutes=offset, due_at=due_at)
+            for event in events.filter(is_canceled=False).select_related('reminder_settings')
+            for offset, due_at in event.get_reminder_due_times()
+        ]
+
+        with transaction.atomic():
+            self.filter(event__in=events.values('pk')).delete()
+            self.bulk_create(due_times, batch_size=500)
+
+
+class ReminderDue(models.Model):
+    """Precomputed due time of a single reminder of an event."""
+    event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name="reminder_due_times")
+
+    offset_minutes = models.PositiveIntegerField(null=True, blank=True,
+                                                 help_text="Minutes before the event, empty for a fixed reminder time.",
+                                                 verbose_name="Offset Minutes")
+    due_at = models.DateTimeField(help_text="The date and time the reminder is due.", verbose_name="Due At")
+
+    objects = ReminderDueManager()
+
+    class Meta:
+        ordering = ['due_at']
+        indexes = [models.Index(fields=['due_at'])]
+        verbose_name = "Reminder Due Time"
+        verbose_name_plural = "Reminder Due Times"
+
+    def __str__(self):
+        return f"Reminder for {self.event.title} at {self.due_at}"
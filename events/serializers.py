@@ -1,27 +1,89 @@
+from django.db import transaction
 from rest_framework import serializers
 
-from .models import Event, ReminderSettings, NotificationMethodsChoices
+from .constants import MAX_REMINDER_OFFSET_MINUTES
+from .models import Event, ReminderSettings, ReminderDue, NotificationMethodsChoices
 
 
 class ReminderSettingsSerializer(serializers.ModelSerializer):
     notification_methods = serializers.ListField(
         child=serializers.ChoiceField(choices=NotificationMethodsChoices.choices)
     )
+    reminder_offsets = serializers.ListField(
+        child=serializers.IntegerField(min_value=0, max_value=MAX_REMINDER_OFFSET_MINUTES), required=False
+    )
 
     class Meta:
         model = ReminderSettings
-        fields = ['reminder_time', 'notification_methods',
+        fields = ['reminder_time', 'reminder_offsets', 'notification_methods',
                   'reminder_note']
 
 
 class EventSerializer(serializers.ModelSerializer):
     reminder_settings = ReminderSettingsSerializer()
 
+    # Model columns each serializer field reads from, used to trim the SQL column list.
+    FIELD_COLUMNS = {
+        'id': ['id'],
+        'category': ['category'],
+        'title': ['title'],
+        'description': ['description'],
+        'is_upcoming': ['event_date', 'event_time'],
+        'event_date': ['event_date'],
+        'event_time': ['event_time'],
+        'is_canceled': ['is_canceled'],
+        'reminder_settings': [f'reminder_settings__{name}' for name in ReminderSettingsSerializer.Meta.fields],
+    }
+
+    # Event fields that move the due times of its reminders.
+    RESCHEDULE_FIELDS = {'category', 'event_date', 'event_time', 'is_canceled'}
+
     class Meta:
         model = Event
         fields = ['id', 'category', 'title', 'description', 'is_upcoming', 'event_date', 'event_time', 'is_canceled',
                   'reminder_settings']
 
+    def __init__(self, *args, **kwargs):
+        """Accept optional `fields` / `omit` iterables to serialize only a subset of the fields."""
+        fields = kwargs.pop('fields', None)
+        omit = kwargs.pop('omit', None)
+        super().__init__(*args, **kwargs)
+
+        for field_name in set(self.fields) - self.resolve_field_names(fields, omit):
+            self.fields.pop(field_name)
+
+    @classmethod
+    def resolve_field_names(cls, fields=None, omit=None):
+        """Return the set of field names left after applying `fields` and `omit`."""
+        field_names = set(cls.Meta.fields)
+        errors = {}
+        for param, requested in (('fields', fields), ('omit', omit)):
+            unknown = set(requested or []) - field_names
+            if unknown:
+                errors[param] = f"Unknown field(s): {', '.join(sorted(unknown))}."
+        if errors:
+            raise serializers.ValidationError(errors)
+
+        if fields:
+            field_names &= set(fields)
+        if omit:
+            field_names -= set(omit)
+        return field_names
+
+    @classmethod
+    def sparse_queryset(cls, queryset, fields=None, omit=None):
+        """Restrict `queryset` to the columns and joins needed to serialize the requested fields."""
+        field_names = cls.resolve_field_names(fields, omit)
+
+        if 'reminder_settings' in field_names:
+            queryset = queryset.select_related('reminder_settings')
+
+        if fields or omit:
+            columns = {column for name in field_names for column in cls.FIELD_COLUMNS[name]}
+            queryset = queryset.only('id', *columns)
+        return queryset
+
+    @transaction.atomic
     def create(self, validated_data):
         reminder_settings_data = validated_data.pop('reminder_settings', None)
         event = Event.objects.create(**validated_data)
@@ -29,14 +91,16 @@ class EventSerializer(serializers.ModelSerializer):
         if reminder_settings_data:
             ReminderSettings.objects.create(event=event, **reminder_settings_data)
 
+        ReminderDue.objects.recompute(Event.objects.filter(pk=event.pk))
         return event
 
+    @transaction.atomic
     def update(self, instance, validated_data):
         reminder_settings_data = validated_data.pop('reminder_settings', None)
 
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
-        instance.save()
+        instance.save(update_fields=[*validated_data, 'updated_at'])
 
         if reminder_settings_data:
             if hasattr(instance, 'reminder_settings'):
@@ -47,4 +111,7 @@ class EventSerializer(serializers.ModelSerializer):
             else:
                 ReminderSettings.objects.create(event=instance, **reminder_settings_data)
 
+        if reminder_settings_data or self.RESCHEDULE_FIELDS.intersection(validated_data):
+            ReminderDue.objects.recompute(Event.objects.filter(pk=instance.pk))
+
         return instance
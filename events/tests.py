@@ -1,3 +1,607 @@
-from django.test import TestCase
+import datetime
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.core.management import CommandError, call_command
+from django.db import IntegrityError, OperationalError, connection, transaction
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from events import group_commit
+from events.constants import (CategoryChoices, DEFAULT_REMINDER_OFFSETS, MAX_DUE_WINDOW_MINUTES,
+                              MAX_REMINDER_OFFSET_MINUTES)
+from events.models import Event, ReminderDue, ReminderSettings
+
+
+def create_event(hours_from_now=2, category=CategoryChoices.WORK, reminder_settings=True, **kwargs):
+    """Create an event starting `hours_from_now` hours from now, with reminder settings by default."""
+    start = timezone.localtime() + datetime.timedelta(hours=hours_from_now)
+    event = Event.objects.create(
+        category=category,
+        title=kwargs.pop('title', "Team Meeting"),
+        description=kwargs.pop('description', "Discuss project updates and milestones."),
+        event_date=start.date(),
+        event_time=start.time().replace(microsecond=0),
+        **kwargs
+    )
+    if reminder_settings:
+        ReminderSettings.objects.create(event=event, notification_methods=['SMS'], reminder_note="Reminder")
+    return event
+
+
+class SparseFieldsetTests(TestCase):
+    """Tests for the `fields` / `omit` query params of the event read endpoints."""
+
+    def setUp(self):
+        self.event = create_event()
+        create_event(title="Budget Review")
+
+    def get(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        return response, queries
+
+    def assert_sparse_response(self, url, expected_fields):
+        response, queries = self.get(url)
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        rows = data if isinstance(data, list) else [data]
+        self.assertTrue(rows)
+        for row in rows:
+            self.assertEqual(set(row), expected_fields)
+        return queries
+
+    def test_fields_trims_output_and_columns(self):
+        urls = [
+            '/api/events/?fields=id,title',
+            f'/api/events/{self.event.pk}/?fields=id,title',
+            '/api/events/upcoming/?fields=id,title',
+            f'/api/events/category/{CategoryChoices.WORK}/?fields=id,title',
+        ]
+        for url in urls:
+            with self.subTest(url=url):
+                queries = self.assert_sparse_response(url, {'id', 'title'})
+                sql = queries.captured_queries[-1]['sql']
+                self.assertIn('"events_event"."title"', sql)
+                self.assertNotIn('"events_event"."description"', sql)
+                self.assertNotIn('events_remindersettings', sql)
+
+    def test_omit_trims_output_and_columns(self):
+        queries = self.assert_sparse_response(
+            '/api/events/?omit=description,reminder_settings',
+            {'id', 'category', 'title', 'is_upcoming', 'event_date', 'event_time', 'is_canceled'}
+        )
+        sql = queries.captured_queries[-1]['sql']
+        self.assertNotIn('"events_event"."description"', sql)
+        self.assertNotIn('events_remindersettings', sql)
+
+    def test_reminder_settings_are_joined_in_a_single_query(self):
+        response, queries = self.get('/api/events/?fields=id,reminder_settings')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(set(response.json()[0]), {'id', 'reminder_settings'})
+        self.assertIn('events_remindersettings', queries.captured_queries[0]['sql'])
+
+    def test_full_list_joins_reminder_settings(self):
+        response, queries = self.get('/api/events/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(queries), 1)
+        self.assertIn('reminder_settings', response.json()[0])
+
+    def test_unknown_fields_are_rejected(self):
+        urls = [
+            '/api/events/?fields=id,bogus',
+            f'/api/events/{self.event.pk}/?fields=bogus',
+            '/api/events/upcoming/?fields=bogus',
+            f'/api/events/category/{CategoryChoices.WORK}/?fields=bogus',
+        ]
+        for url in urls:
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.json(), {'fields': "Unknown field(s): bogus."})
+
+    def test_unknown_omit_is_reported_under_omit(self):
+        response = self.client.get('/api/events/?omit=bogus')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'omit': "Unknown field(s): bogus."})
+
+    def test_writes_ignore_sparse_fields(self):
+        response = self.client.patch(f'/api/events/{self.event.pk}/?fields=title', data={'title': "Renamed"},
+                                     content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('description', response.json())
+        self.assertEqual(Event.objects.get(pk=self.event.pk).title, "Renamed")
+
+
+class SoftDeleteTests(TestCase):
+    """Tests for canceling events with a conditional update."""
+
+    def test_soft_delete_only_succeeds_once(self):
+        event = create_event()
+        updated_at = event.updated_at
+
+        self.assertTrue(event.soft_delete())
+        self.assertFalse(Event.objects.get(pk=event.pk).soft_delete())
+
+        event.refresh_from_db()
+        self.assertTrue(event.is_canceled)
+        self.assertGreater(event.updated_at, updated_at)
+
+    def test_cancel_endpoint(self):
+        event = create_event()
+
+        response = self.client.post(f'/api/events/{event.pk}/cancel/')
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.post(f'/api/events/{event.pk}/cancel/')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"detail": "This event is already canceled."})
+
+        response = self.client.post('/api/events/0/cancel/')
+        self.assertEqual(response.status_code, 404)
+
+    def test_cancel_endpoint_when_group_commit_times_out(self):
+        event = create_event()
+
+        with mock.patch.object(Event, 'soft_delete', side_effect=TimeoutError):
+            response = self.client.post(f'/api/events/{event.pk}/cancel/')
+        self.assertEqual(response.status_code, 503)
+        event.refresh_from_db()
+        self.assertFalse(event.is_canceled)
+
+    def test_cancel_endpoint_when_group_commit_fails_after_applying(self):
+        event = create_event()
+
+        def cancel_then_fail(*args, **kwargs):
+            Event.objects.filter(pk=event.pk).update(is_canceled=True)
+            raise OperationalError("database is locked")
+
+        with mock.patch.object(Event, 'soft_delete', side_effect=cancel_then_fail):
+            response = self.client.post(f'/api/events/{event.pk}/cancel/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"detail": "Event successfully canceled."})
+
+
+class RecordingWriter(group_commit.GroupCommitWriter):
+    """Group commit writer recording the size of every committed group."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.batch_sizes = []
+
+    def _commit(self, batch):
+        self.batch_sizes.append(len(batch))
+        super()._commit(batch)
+
+
+class GroupCommitWriterTests(TransactionTestCase):
+    """Tests for the background group commit writer."""
+
+    def setUp(self):
+        self.events = [create_event(reminder_settings=False) for _ in range(3)]
+
+    def test_updates_within_the_window_share_a_group(self):
+        writer = RecordingWriter(window_ms=200)
+
+        futures = [writer.submit(Event.objects.filter(pk=event.pk), is_canceled=True) for event in self.events]
+
+        self.assertEqual([future.result(timeout=5) for future in futures], [1, 1, 1])
+        self.assertEqual(writer.batch_sizes, [3])
+        self.assertEqual(Event.objects.filter(is_canceled=True).count(), 3)
+
+    def test_group_size_is_capped(self):
+        writer = RecordingWriter(window_ms=200, max_batch=2)
+
+        futures = [writer.submit(Event.objects.filter(pk=event.pk), is_canceled=True) for event in self.events]
+
+        for future in futures:
+            future.result(timeout=5)
+        self.assertEqual(writer.batch_sizes, [2, 1])
+
+    def test_update_returns_row_count(self):
+        writer = group_commit.GroupCommitWriter(window_ms=1)
+
+        self.assertEqual(writer.update(Event.objects.all(), is_canceled=True), 3)
+        self.assertEqual(writer.update(Event.objects.filter(is_canceled=False), is_canceled=True), 0)
+
+    def test_failing_update_only_fails_its_caller(self):
+        writer = RecordingWriter(window_ms=200)
+        first, second, third = self.events
+
+        futures = [
+            writer.submit(Event.objects.filter(pk=first.pk), is_canceled=True),
+            writer.submit(Event.objects.filter(pk=second.pk), title=None),
+            writer.submit(Event.objects.filter(pk=third.pk), is_canceled=True),
+        ]
+
+        self.assertEqual(futures[0].result(timeout=5), 1)
+        with self.assertRaises(IntegrityError):
+            futures[1].result(timeout=5)
+        self.assertEqual(futures[2].result(timeout=5), 1)
+        self.assertEqual(writer.batch_sizes, [3])
+        self.assertEqual(set(Event.objects.filter(is_canceled=True).values_list('pk', flat=True)),
+                         {first.pk, third.pk})
+
+    def test_update_times_out_and_is_skipped(self):
+        class SlowWriter(group_commit.GroupCommitWriter):
+            def _commit(self, batch):
+                time.sleep(0.3)
+                super()._commit(batch)
+
+        writer = SlowWriter(window_ms=1, timeout=0.05)
+        event = self.events[0]
+
+        with self.assertRaises(TimeoutError):
+            writer.update(Event.objects.filter(pk=event.pk), is_canceled=True)
+
+        time.sleep(0.5)
+        event.refresh_from_db()
+        self.assertFalse(event.is_canceled)
+
+    def test_update_timing_out_while_applied_is_still_committed(self):
+        class SlowUpdate:
+            def __init__(self, queryset):
+                self.queryset = queryset
+
+            def update(self, **values):
+                time.sleep(0.3)
+                return self.queryset.update(**values)
+
+        writer = group_commit.GroupCommitWriter(window_ms=1, timeout=0.1)
+        event = self.events[0]
+
+        with self.assertRaises(TimeoutError):
+            writer.update(SlowUpdate(Event.objects.filter(pk=event.pk)), is_canceled=True)
+
+        time.sleep(0.5)
+        event.refresh_from_db()
+        self.assertTrue(event.is_canceled)
+
+    @override_settings(EVENTS_GROUP_COMMIT_ENABLED=True)
+    def test_soft_delete_with_group_commit(self):
+        event = self.events[0]
+
+        self.assertTrue(event.soft_delete())
+        self.assertFalse(event.soft_delete())
+        event.refresh_from_db()
+        self.assertTrue(event.is_canceled)
+
+    def test_updates_inside_a_transaction_bypass_the_writer(self):
+        writer = RecordingWriter(window_ms=1)
+        event = self.events[0]
+
+        with transaction.atomic():
+            self.assertEqual(group_commit.update(Event.objects.filter(pk=event.pk), writer=writer, is_canceled=True), 1)
+            transaction.set_rollback(True)
+
+        self.assertEqual(writer.batch_sizes, [])
+        event.refresh_from_db()
+        self.assertFalse(event.is_canceled)
+
+
+class BenchmarkCancelContentionTests(TransactionTestCase):
+    """Tests for the cancel contention benchmark command."""
+
+    def test_requires_allow_writes(self):
+        with self.assertRaises(CommandError):
+            call_command('benchmark_cancel_contention', events=1)
+
+    def test_rejects_empty_runs(self):
+        with self.assertRaises(CommandError):
+            call_command('benchmark_cancel_contention', events=0, allow_writes=True)
+
+    def test_only_deletes_its_own_events(self):
+        from events.management.commands.benchmark_cancel_contention import BENCHMARK_TITLE
+        event = create_event(title=BENCHMARK_TITLE, reminder_settings=False)
+
+        call_command('benchmark_cancel_contention', events=4, threads=2, allow_writes=True, stdout=io.StringIO())
+
+        self.assertEqual(list(Event.objects.values_list('pk', flat=True)), [event.pk])
+
+    def test_deletes_its_events_when_a_run_fails(self):
+        with mock.patch.object(Event, 'soft_delete', side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                call_command('benchmark_cancel_contention', events=2, threads=1, allow_writes=True)
+
+        self.assertFalse(Event.objects.exists())
+
+
+def run_python(code, settings_module='base.settings', **env):
+    """Run `code` in a fresh interpreter from the project directory and return the completed process."""
+    env = {**os.environ, 'DJANGO_SETTINGS_MODULE': settings_module, **env}
+    return subprocess.run([sys.executable, '-c', code], env=env, cwd=settings.BASE_DIR,
+                          capture_output=True, text=True)
+
+
+class StartupProfileTests(TestCase):
+    """Tests for the lazily loaded API docs and the production settings profile."""
+
+    LOAD_URLS = (
+        "import sys, django; django.setup(); "
+        "from django.urls import get_resolver; get_resolver().url_patterns; "
+    )
+
+    def test_loading_urls_does_not_import_drf_yasg_views(self):
+        result = run_python(self.LOAD_URLS + "print(any(name.startswith('drf_yasg.') and name != 'drf_yasg.apps' "
+                                             "for name in sys.modules))")
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), 'False')
+
+    def test_production_profile_does_not_import_drf_yasg(self):
+        result = run_python(self.LOAD_URLS + "print('drf_yasg' in sys.modules)",
+                            'base.settings_production', DJANGO_SECRET_KEY='test')
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), 'False')
+
+    def test_production_profile_has_no_admin_or_docs_routes(self):
+        code = self.LOAD_URLS + (
+            "from django.urls import resolve, Resolver404\n"
+            "for path in ('/admin/', '/swagger/', '/redoc/'):\n"
+            "    try:\n"
+            "        resolve(path)\n"
+            "        print(path)\n"
+            "    except Resolver404:\n"
+            "        pass\n"
+            "resolve('/api/events/')\n"
+            "resolve('/swagger.json')"
+        )
+        result = run_python(code, 'base.settings_production', DJANGO_SECRET_KEY='test')
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), '')
+
+    def test_production_profile_requires_secret_key(self):
+        env = {key: value for key, value in os.environ.items() if key != 'DJANGO_SECRET_KEY'}
+        result = subprocess.run([sys.executable, '-c', "import django; django.setup()"],
+                                env={**env, 'DJANGO_SETTINGS_MODULE': 'base.settings_production'},
+                                cwd=settings.BASE_DIR, capture_output=True, text=True)
+        self.assertNotEqual(result.returncode, 0)
+        self.assertIn('ImproperlyConfigured', result.stderr)
+        self.assertIn('DJANGO_SECRET_KEY', result.stderr)
+
+    def test_docs_pages_render_through_lazy_views(self):
+        for url in ('/swagger/', '/redoc/', '/swagger/?format=openapi'):
+            with self.subTest(url=url):
+                self.assertEqual(self.client.get(url).status_code, 200)
+
+    def test_static_schema(self):
+        with tempfile.TemporaryDirectory() as directory:
+            schema_file = os.path.join(directory, 'openapi.json')
+
+            with self.settings(API_SCHEMA_FILE=schema_file):
+                self.assertEqual(self.client.get('/swagger.json').status_code, 404)
+
+                with open(schema_file, 'w') as schema:
+                    schema.write('{"swagger": "2.0"}')
+                response = self.client.get('/swagger.json')
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response['Content-Type'], 'application/json')
+                self.assertEqual(b''.join(response.streaming_content), b'{"swagger": "2.0"}')
+                response.close()
+
+    def test_measure_startup_reports_probe_errors(self):
+        probe = "import sys; sys.exit('probe exploded')"
+        with mock.patch('events.management.commands.measure_startup.PROBE', probe):
+            with self.assertRaisesMessage(CommandError, 'probe exploded'):
+                call_command('measure_startup', runs=1, stdout=io.StringIO())
+
+
+class ReminderDueTests(TestCase):
+    """Tests for resolving reminder offsets into the precomputed due time table."""
+
+    def create(self, minutes_from_now=120, category=CategoryChoices.CONCERT, **reminder_settings):
+        start = timezone.localtime() + datetime.timedelta(minutes=minutes_from_now)
+        payload = {
+            "category": category,
+            "title": "Rock Concert",
+            "description": "Enjoy live music with the best rock bands in the city.",
+            "event_date": str(start.date()),
+            "event_time": start.strftime('%H:%M:%S'),
+            "reminder_settings": {"notification_methods": ["SMS"], "reminder_note": "Reminder", **reminder_settings},
+        }
+        response = self.client.post('/api/events/', data=payload, content_type='application/json')
+        self.assertEqual(response.status_code, 201, response.content)
+        return Event.objects.get(pk=response.json()['id'])
+
+    def patch(self, event, payload):
+        response = self.client.patch(f'/api/events/{event.pk}/', data=payload, content_type='application/json')
+        self.assertEqual(response.status_code, 200, response.content)
+        event.refresh_from_db()
+
+    def due_times(self, event):
+        return list(ReminderDue.objects.filter(event=event).values_list('offset_minutes', 'due_at'))
+
+    def expected(self, event, offsets):
+        return [(offset, event.event_datetime - datetime.timedelta(minutes=offset))
+                for offset in sorted(offsets, reverse=True)]
+
+    def test_create_uses_offsets(self):
+        event = self.create(reminder_offsets=[10, 60])
+        self.assertEqual(self.due_times(event), self.expected(event, [10, 60]))
+
+    def test_create_falls_back_to_category_defaults(self):
+        event = self.create()
+        self.assertEqual(self.due_times(event), self.expected(event, DEFAULT_REMINDER_OFFSETS[CategoryChoices.CONCERT]))
+
+    def test_reminder_time_replaces_category_defaults(self):
+        reminder_time = timezone.now().replace(microsecond=0) + datetime.timedelta(minutes=30)
+        event = self.create(reminder_time=reminder_time.isoformat())
+        self.assertEqual(self.due_times(event), [(None, reminder_time)])
+
+    def test_moving_the_event_recomputes_due_times(self):
+        event = self.create(reminder_offsets=[10])
+
+        self.patch(event, {"event_date": str(event.event_date + datetime.timedelta(days=1))})
+        self.assertEqual(self.due_times(event), self.expected(event, [10]))
+
+        self.patch(event, {"event_time": "09:30:00"})
+        self.assertEqual(self.due_times(event), self.expected(event, [10]))
+
+    def test_category_change_recomputes_default_offsets(self):
+        event = self.create()
+
+        self.patch(event, {"category": CategoryChoices.WORK})
+        self.assertEqual(self.due_times(event), self.expected(event, DEFAULT_REMINDER_OFFSETS[CategoryChoices.WORK]))
+
+    def test_offset_change_recomputes_due_times(self):
+        event = self.create(reminder_offsets=[10])
+
+        self.patch(event, {"reminder_settings": {"reminder_offsets": [5, 45], "notification_methods": ["SMS"]}})
+        self.assertEqual(self.due_times(event), self.expected(event, [5, 45]))
+
+    def test_canceled_events_are_not_due(self):
+        event = self.create(minutes_from_now=30, reminder_offsets=[28])
+        url = '/api/events/reminders/due/?next_minutes=5'
+        self.assertEqual([row['event_id'] for row in self.client.get(url).json()], [event.pk])
+
+        event.soft_delete()
+        self.assertEqual(self.client.get(url).json(), [])
+
+        self.patch(event, {"is_canceled": False})
+        self.assertEqual(self.due_times(event), self.expected(event, [28]))
+        self.assertEqual([row['event_id'] for row in self.client.get(url).json()], [event.pk])
+
+    def test_due_reminders_window(self):
+        event = self.create(minutes_from_now=30, reminder_offsets=[28, 20, 60])
+
+        response = self.client.get('/api/events/reminders/due/?next_minutes=5')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([(row['event_id'], row['offset_minutes']) for row in response.json()], [(event.pk, 28)])
+
+        response = self.client.get('/api/events/reminders/due/?next_minutes=15')
+        self.assertEqual([row['offset_minutes'] for row in response.json()], [28, 20])
+
+        response = self.client.get('/api/events/reminders/due/?next_minutes=1')
+        self.assertEqual(response.json(), [])
+
+        for next_minutes in ('soon', '0', '-5', str(MAX_DUE_WINDOW_MINUTES + 1), '99999999999'):
+            with self.subTest(next_minutes=next_minutes):
+                response = self.client.get(f'/api/events/reminders/due/?next_minutes={next_minutes}')
+                self.assertEqual(response.status_code, 400)
+
+    def test_reminder_offsets_validation(self):
+        event = create_event()
+        reminder_settings = event.reminder_settings
+
+        for offsets in (["15"], [-5], [True], [MAX_REMINDER_OFFSET_MINUTES + 1], 15, {"minutes": 15}):
+            with self.subTest(offsets=offsets):
+                reminder_settings.reminder_offsets = offsets
+                with self.assertRaises(ValidationError):
+                    reminder_settings.full_clean()
+
+        reminder_settings.reminder_offsets = [0, 15, MAX_REMINDER_OFFSET_MINUTES]
+        reminder_settings.full_clean()
+
+    def test_out_of_range_offsets_are_rejected_by_the_api(self):
+        start = timezone.localtime() + datetime.timedelta(hours=2)
+        payload = {
+            "category": CategoryChoices.WORK,
+            "title": "Team Meeting",
+            "description": "Discuss project updates and milestones.",
+            "event_date": str(start.date()),
+            "event_time": start.strftime('%H:%M:%S'),
+            "reminder_settings": {"notification_methods": ["SMS"], "reminder_offsets": [2147483647]},
+        }
+        response = self.client.post('/api/events/', data=payload, content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Event.objects.exists())
+
+    def test_offsets_before_the_earliest_date_are_skipped(self):
+        event = create_event()
+        Event.objects.filter(pk=event.pk).update(event_date=datetime.date(1, 1, 2), event_time=datetime.time(0, 30))
+        ReminderSettings.objects.filter(event=event).update(reminder_offsets=[10, MAX_REMINDER_OFFSET_MINUTES])
+
+        call_command('recompute_reminders', stdout=io.StringIO())
+        self.assertEqual([offset for offset, _ in self.due_times(event)], [10])
+
+    def test_failed_recompute_rolls_back_the_event(self):
+        event = self.create(reminder_offsets=[10])
+
+        with mock.patch.object(ReminderDue.objects, 'recompute', side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                self.client.patch(f'/api/events/{event.pk}/', data={"title": "Renamed", "category": "Work"},
+                                  content_type='application/json')
+            with self.assertRaises(RuntimeError):
+                self.create(reminder_offsets=[5])
+
+        event.refresh_from_db()
+        self.assertEqual(event.title, "Rock Concert")
+        self.assertEqual(Event.objects.count(), 1)
+        self.assertEqual(ReminderSettings.objects.count(), 1)
+
+    def test_invalid_stored_offsets_are_ignored(self):
+        event = create_event(category=CategoryChoices.WORK)
+        ReminderSettings.objects.filter(event=event).update(reminder_offsets=["15", -5, 30])
+
+        ReminderDue.objects.recompute(Event.objects.filter(pk=event.pk))
+        self.assertEqual(self.due_times(event), self.expected(event, [30]))
+
+
+class ReminderDueAdminTests(TestCase):
+    """Tests for keeping reminder due times in sync with admin edits."""
+
+    def setUp(self):
+        self.client.force_login(User.objects.create_superuser('admin', 'admin@example.com', 'password'))
+
+    def test_uncanceling_from_canceled_events_admin_recomputes(self):
+        event = create_event()
+        event.soft_delete()
+        ReminderDue.objects.recompute(Event.objects.filter(pk=event.pk))
+        self.assertFalse(ReminderDue.objects.filter(event=event).exists())
+
+        response = self.client.post(f'/admin/events/canceledevent/{event.pk}/change/', data={
+            'category': event.category,
+            'title': event.title,
+            'description': event.description,
+            'event_date': event.event_date.isoformat(),
+            'event_time': event.event_time.isoformat(),
+        })
+        self.assertEqual(response.status_code, 302)
+        event.refresh_from_db()
+        self.assertFalse(event.is_canceled)
+        self.assertTrue(ReminderDue.objects.filter(event=event).exists())
+
+    def test_invalid_offsets_are_rejected_by_the_admin_form(self):
+        event = create_event(reminder_settings=False)
+
+        for offsets in ('["15"]', '[-5]'):
+            with self.subTest(offsets=offsets):
+                response = self.client.post('/admin/events/remindersettings/add/', data={
+                    'event': event.pk,
+                    'notification_methods': ['SMS'],
+                    'reminder_offsets': offsets,
+                })
+                self.assertEqual(response.status_code, 200)
+                self.assertIn('reminder_offsets', response.context['adminform'].form.errors)
+        self.assertFalse(ReminderSettings.objects.filter(event=event).exists())
+
+    def test_deleting_reminder_settings_falls_back_to_category_defaults(self):
+        events = [create_event(category=CategoryChoices.WORK) for _ in range(2)]
+        ReminderSettings.objects.update(reminder_offsets=[5])
+        ReminderDue.objects.recompute(Event.objects.all())
+        defaults = DEFAULT_REMINDER_OFFSETS[CategoryChoices.WORK]
+
+        first, second = events
+        response = self.client.post(f'/admin/events/remindersettings/{first.reminder_settings.pk}/delete/',
+                                    data={'post': 'yes'})
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(list(ReminderDue.objects.filter(event=first).values_list('offset_minutes', flat=True)),
+                         defaults)
+
+        response = self.client.post('/admin/events/remindersettings/', data={
+            'action': 'delete_selected',
+            '_selected_action': [second.reminder_settings.pk],
+            'post': 'yes',
+        })
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(list(ReminderDue.objects.filter(event=second).values_list('offset_minutes', flat=True)),
+                         defaults)
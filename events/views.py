@@ -1,9 +1,11 @@
+from django.db import DatabaseError
 from django.db.models import Q
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django.utils import timezone
-from .models import Event
+from .constants import MAX_DUE_WINDOW_MINUTES
+from .models import Event, ReminderDue
 from .serializers import EventSerializer
 import datetime
 
@@ -12,6 +14,32 @@ class EventViewSet(viewsets.ModelViewSet):
     serializer_class = EventSerializer
     queryset = Event.objects.all()
 
+    def get_sparse_fields(self):
+        """Parse the comma separated `fields` / `omit` query params of a read request."""
+        if self.request is None or self.request.method != 'GET':
+            return {}
+
+        sparse_fields = {}
+        for param in ('fields', 'omit'):
+            value = self.request.query_params.get(param)
+            if value:
+                sparse_fields[param] = [name.strip() for name in value.split(',') if name.strip()]
+        return sparse_fields
+
+    def get_sparse_queryset(self, queryset):
+        """Trim the SQL column list and joins of `queryset` to the requested fields."""
+        return self.get_serializer_class().sparse_queryset(queryset, **self.get_sparse_fields())
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action in ('list', 'retrieve'):
+            queryset = self.get_sparse_queryset(queryset)
+        return queryset
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs.update(self.get_sparse_fields())
+        return super().get_serializer(*args, **kwargs)
+
     @action(detail=True, methods=['post'], url_path='cancel')
     def cancel(self, request, pk=None):
         """Cancel an event by setting is_canceled to True."""
@@ -23,14 +51,23 @@ class EventViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_404_NOT_FOUND
             )
 
-        if event.is_canceled:
+        try:
+            canceled = event.soft_delete()
+        except (TimeoutError, DatabaseError):
+            # The group commit may have timed out or failed after applying the update, so re-check the row.
+            if Event.objects.filter(pk=event.pk, is_canceled=True).exists():
+                return Response({"detail": "Event successfully canceled."}, status=status.HTTP_200_OK)
+            return Response(
+                {"detail": "The event could not be canceled right now, please try again."},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+
+        if not canceled:
             return Response(
                 {"detail": "This event is already canceled."},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        event.is_canceled = True
-        event.save()
         return Response({"detail": "Event successfully canceled."}, status=status.HTTP_200_OK)
 
     def destroy(self, request, *args, **kwargs):
@@ -69,11 +106,41 @@ class EventViewSet(viewsets.ModelViewSet):
         if not show_canceled:
             upcoming_events = upcoming_events.exclude(is_canceled=True)
 
-        upcoming_events = upcoming_events.order_by('event_date', 'event_time')
+        upcoming_events = self.get_sparse_queryset(upcoming_events.order_by('event_date', 'event_time'))
 
         serializer = self.get_serializer(upcoming_events, many=True)
         return Response(serializer.data)
 
+    @action(detail=False, methods=['get'], url_path='reminders/due')
+    def due_reminders(self, request):
+        """List reminders of non canceled events that are due within the next minutes."""
+
+        now = timezone.now()
+        next_minutes = request.query_params.get('next_minutes', 1)
+
+        try:
+            next_minutes = int(next_minutes)
+        except ValueError:
+            return Response({'error': 'Invalid next_minutes parameter, must be an integer.'}, status=400)
+
+        if not 1 <= next_minutes <= MAX_DUE_WINDOW_MINUTES:
+            return Response(
+                {'error': f'Invalid next_minutes parameter, must be between 1 and {MAX_DUE_WINDOW_MINUTES}.'},
+                status=400
+            )
+
+        due_reminders = ReminderDue.objects.due_between(now, now + datetime.timedelta(minutes=next_minutes))
+
+        return Response([
+            {
+                "event_id": reminder.event_id,
+                "event_title": reminder.event.title,
+                "offset_minutes": reminder.offset_minutes,
+                "due_at": reminder.due_at,
+            }
+            for reminder in due_reminders
+        ])
+
     @action(detail=False, methods=['get'], url_path='category/(?P<category_name>[^/.]+)')
     def by_category(self, request, category_name=None):
         """Retrieve events by category."""
@@ -106,7 +173,7 @@ class EventViewSet(viewsets.ModelViewSet):
         :param category_name: Category name to filter events
         :return: Response object with serialized event data
         """
-        events = Event.objects.filter(category=category_name)
+        events = self.get_sparse_queryset(Event.objects.filter(category=category_name))
         if not events.exists():
             return Response({"error": "No events found in this category."}, status=400)
         serializer = self.get_serializer(events, many=True)
@@ -124,6 +191,7 @@ class EventViewSet(viewsets.ModelViewSet):
                 "event_id": event.id,
                 "event_title": event.title,
                 "reminder_time": reminder_settings.reminder_time,
+                "reminder_offsets": reminder_settings.reminder_offsets,
                 "notification_methods": reminder_settings.notification_methods,
                 "reminder_note": reminder_settings.reminder_note
             })